@@ -1,11 +1,15 @@
-from .broker import (
-    ConnectionPooledKombuBroker,
-    ConnectionSharedKombuBroker,
-    KombuBroker,
-    KombuConnectionOptions,
-    KombuTransportOptions,
-)
-from .consumer import MessageProxy
+import importlib
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .broker import (
+        ConnectionPooledKombuBroker,
+        ConnectionSharedKombuBroker,
+        KombuBroker,
+        KombuConnectionOptions,
+        KombuTransportOptions,
+    )
+    from .consumer import MessageProxy
 
 __all__ = [
     "MessageProxy",
@@ -15,3 +19,28 @@ __all__ = [
     "KombuTransportOptions",
     "KombuConnectionOptions",
 ]
+
+# public name -> submodule, imported on first access (PEP 562)
+_lazy_imports = {
+    "MessageProxy": ".consumer",
+    "KombuBroker": ".broker",
+    "ConnectionPooledKombuBroker": ".broker",
+    "ConnectionSharedKombuBroker": ".broker",
+    "KombuTransportOptions": ".broker",
+    "KombuConnectionOptions": ".broker",
+}
+
+
+def __getattr__(name: str) -> tp.Any:
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # next access will not call __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
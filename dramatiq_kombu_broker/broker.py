@@ -1,5 +1,6 @@
 import contextlib
-import datetime as dt
+import functools
+import itertools
 import logging
 import socket
 import threading
@@ -19,10 +20,20 @@ from .connection_holder import ConnectionHolder
 from .consumer import DramatiqConsumer, ThreadSafeDramatiqConsumer
 from .pooled_connection_holder import PooledConnectionHolder
 from .shared_connection_holder import SharedConnectionHolder
-from .topology import DefaultDramatiqTopology
+from .topology import DefaultDramatiqTopology, QueueName
 
 DEFAULT_QUEUE_NAME = "default"
 
+#: default connection_name, hostname does not change while process alive
+_HOSTNAME = socket.gethostname()
+
+errback_logger = logging.getLogger("KombuBroker")
+
+
+def _is_channel_open(channel) -> bool:
+    # kombu virtual transport channels have no is_open and are not closed by errors
+    return getattr(channel, "is_open", True)
+
 
 class KombuTransportOptions(tp.TypedDict, total=False):
     """
@@ -66,6 +77,9 @@ class KombuBroker(Broker):
     connection_holder_cls: tp.Optional[type[ConnectionHolder]] = None
     connection_holder: ConnectionHolder
 
+    #: join() doubles polling interval while queue is not empty, up to idle_time * factor
+    join_max_backoff_factor: int = 8
+
     def __init__(
         self,
         middleware=None,
@@ -79,22 +93,28 @@ class KombuBroker(Broker):
         max_enqueue_attempts: tp.Optional[int] = None,
         max_declare_attempts: tp.Optional[int] = None,
         max_producer_acquire_timeout: tp.Optional[float] = 10,
+        fast_publish: bool = False,
     ):
         super().__init__(
             middleware=middleware,
         )
 
-        transport_options = kombu_connection_options.pop("transport_options", None) or {}
+        # do not modify given options, they can be reused to create another broker
+        connection_options: dict[str, tp.Any] = dict(kombu_connection_options)
+        transport_options: dict[str, tp.Any] = dict(
+            connection_options.pop("transport_options", None) or {}
+        )
         transport_options["confirm_publish"] = confirm_delivery
 
-        client_properties = transport_options.setdefault("client_properties", {})
-        client_properties.setdefault("connection_name", socket.gethostname())
+        client_properties = dict(transport_options.get("client_properties") or {})
+        client_properties.setdefault("connection_name", _HOSTNAME)
+        transport_options["client_properties"] = client_properties
 
         if self.connection_holder_cls is None:
             raise TypeError("connection_holder_cls can not be None")
 
         connection = kombu.Connection(
-            **kombu_connection_options,
+            **connection_options,
             transport_options=transport_options,
         )
 
@@ -102,17 +122,37 @@ class KombuBroker(Broker):
             connection, connection_holder_options or {}
         )
 
-        self._declare_lock = threading.RLock()
+        self._declare_lock = threading.Lock()  # not reentrant, never call declare_queue under it
         self._max_declare_attempts = max_declare_attempts
         self._max_enqueue_attempts = max_enqueue_attempts
         self._max_producer_acquire_timeout = max_producer_acquire_timeout
+        self._fast_publish = fast_publish
+
+        # static part of producer.publish() arguments, built once instead of per message
+        self._publish_options: dict[str, tp.Any] = {
+            "exchange": "",
+            "delivery_mode": 2,
+            "retry": True,
+            "retry_policy": {
+                "max_retries": self._max_enqueue_attempts,
+                "errback": self.on_connection_error_errback,
+            },
+            # will raise amqp.exceptions.ChannelError(312, ...) when route not found (e.g.: queue not exists)
+            "mandatory": True,
+        }
+        # retry covers whole acquire + publish, each attempt acquire producer again
+        self._fast_publish_message = self.connection_holder.retry_connection_errors_over_time(
+            self._publish_on_channel,
+            max_retries=self._max_enqueue_attempts,
+            errback=self.on_connection_error_errback_over_time,
+        )
 
         self._default_queue_name = default_queue_name
         self._blocking_acknowledge = blocking_acknowledge
 
         self.topology = DefaultDramatiqTopology(max_priority=max_priority)
         self.queues_pending: set[str] = set()
-        self.queues: set[str] = set()  # should contain only canonical names
+        self.queues: set[str] = set()  # mutated under _declare_lock, iterate snapshots
 
     def _create_connection_holder(
         self, connection: kombu.Connection, options: dict[str, tp.Any]
@@ -123,6 +163,10 @@ class KombuBroker(Broker):
     def close(self):
         self.connection_holder.close()
 
+    def _get_queue_names(self, queue_name: str) -> QueueName:
+        """Return topology names for given queue, cached by topology"""
+        return self.topology.get_queue_name_tuple(queue_name)
+
     def declare_actor(self, actor: dramatiq.Actor):
         if actor.queue_name == "default" and actor.queue_name != self._default_queue_name:
             self.logger.debug(
@@ -144,15 +188,15 @@ class KombuBroker(Broker):
           tuple: A triple representing the number of messages in the
           queue, its delayed queue and its dead letter queue.
         """
-        delay_queue_name = self.topology.get_delay_queue_name(queue_name)
-        dead_letter_queue_name = self.topology.get_dead_letter_queue_name(queue_name)
+        q_names = self._get_queue_names(queue_name)
+        queue_names = (queue_name, q_names.delayed, q_names.dead_letter)
 
         counts = []
 
         with self.connection_holder.acquire_consumer_channel() as channel:
-            for queue_name in (queue_name, delay_queue_name, dead_letter_queue_name):
+            for queue_name in queue_names:
                 qsize: int
-                _, qsize, _ = kombu.Queue(queue_name).queue_declare(passive=True, channel=channel)
+                _, qsize, _ = channel.queue_declare(queue=queue_name, passive=True)
 
                 counts.append(qsize)
 
@@ -174,28 +218,44 @@ class KombuBroker(Broker):
           min_successes(int): The minimum number of times all the
             polled queues should be empty.
           idle_time(int): The number of milliseconds to wait between
-            counts.
+            counts. While the queue is not empty the interval is doubled
+            up to ``idle_time * join_max_backoff_factor``.
           timeout(Optional[int]): The max amount of time, in
             milliseconds, to wait on this queue.
         """
         deadline = timeout and time.monotonic() + timeout / 1000
         successes = 0
+        sleep_time = idle_time
         while successes < min_successes:
-            start = time.monotonic()
-            if deadline and time.monotonic() >= deadline:
+            now = time.monotonic()
+            if deadline and now >= deadline:
                 raise dramatiq.QueueJoinTimeout(queue_name)
 
             total_messages = sum(self.get_queue_message_counts(queue_name)[:-1])
             if total_messages == 0:
                 successes += 1
+                sleep_time = idle_time  # check emptiness quickly
             else:
                 successes = 0
+                # queue still busy, poll it less often
+                sleep_time = min(sleep_time * 2, idle_time * self.join_max_backoff_factor)
 
             if successes < min_successes:  # do not sleep on last iteration
-                time.sleep(idle_time / 1000)
-
-    def declare_queue(self, queue_name, *, ensure=False):
-        canonical_qname = self.topology.get_canonical_queue_name(queue_name)
+                sleep_seconds = sleep_time / 1000
+                if deadline:
+                    sleep_seconds = min(sleep_seconds, max(deadline - now, 0))
+                time.sleep(sleep_seconds)
+
+    def declare_queue(self, queue_name, *, ensure=False, channel=None):
+        """Declare queue topology
+
+        :param queue_name: queue to declare
+        :param ensure: declare pending queues on server right now
+        :param channel: already acquired channel to declare queues on,
+            by default consumer channel acquired
+        """
+        q_names = self._get_queue_names(queue_name)
+        canonical_qname = q_names.canonical
 
         if canonical_qname not in self.queues:
             with self._declare_lock:
@@ -205,17 +265,58 @@ class KombuBroker(Broker):
                     self.queues_pending.add(canonical_qname)
                     self.emit_after("declare_queue", queue_name)
 
-                    delayed_name = self.topology.get_delay_queue_name(queue_name)
+                    delayed_name = q_names.delayed
                     self.delay_queues.add(delayed_name)
                     self.emit_after("declare_delay_queue", delayed_name)
 
-        if ensure:
+        # steady state: everything declared, nothing to ensure, no need to lock
+        if ensure and self._is_queue_pending(q_names):
             with self._declare_lock:
-                self._ensure_queue(canonical_qname)
+                self._ensure_queue(canonical_qname, channel=channel)
 
-    def _declare_queue(self, queue_name) -> kombu.Queue:
-        queue_name = self.topology.get_canonical_queue_name(queue_name)
-        with self.connection_holder.acquire_consumer_channel() as channel:
+    def _redeclare_queue(self, queue_name):
+        """Forget queue was declared and declare it again (e.g. queue was deleted on server)"""
+        with self._declare_lock:
+            self.queues.discard(self._get_queue_names(queue_name).canonical)
+        self.declare_queue(queue_name, ensure=True)
+
+    def declare_pending_queues(self):
+        """Declare on server all queues still waiting for it (e.g. queues of declared actors)
+
+        Call it on process startup, so first enqueue to each queue will not pay for declaration.
+        See also :class:`dramatiq_kombu_broker.middleware.DeclareQueuesOnBoot`.
+        """
+        canonical_names = {
+            self._get_queue_names(queue_name).canonical for queue_name in tuple(self.queues_pending)
+        }
+        if not canonical_names:
+            return
+
+        # channel closed by declare error is replaced, next queues do not fail on it
+        self._each_queue_over_channel(
+            canonical_names, functools.partial(self.declare_queue, ensure=True)
+        )
+
+    def _is_queue_pending(self, q_names: QueueName) -> bool:
+        """Check any of queue topology names still waiting to be declared"""
+        pending = self.queues_pending
+        if not pending:  # steady state, skip hashing names
+            return False
+        return (
+            q_names.canonical in pending
+            or q_names.delayed in pending
+            or q_names.dead_letter in pending
+        )
+
+    def _maybe_acquire_channel(self, channel=None) -> tp.ContextManager:
+        """Use given channel as is, or acquire new one and release it after"""
+        if channel is not None:
+            return contextlib.nullcontext(channel)
+        return self.connection_holder.acquire_consumer_channel()
+
+    def _declare_queue(self, queue_name, channel=None) -> kombu.Queue:
+        queue_name = self._get_queue_names(queue_name).canonical
+        with self._maybe_acquire_channel(channel) as channel:
             queue = self.topology.declare_canonical_queue(
                 channel, queue_name, ignore_different_topology=True
             )
@@ -224,10 +325,10 @@ class KombuBroker(Broker):
         self.queues_pending.discard(queue_name)
         return queue
 
-    def _declare_dq_queue(self, queue_name):
+    def _declare_dq_queue(self, queue_name, channel=None):
         """Delay queue"""
-        queue_name = self.topology.get_delay_queue_name(queue_name)
-        with self.connection_holder.acquire_consumer_channel() as channel:
+        queue_name = self._get_queue_names(queue_name).delayed
+        with self._maybe_acquire_channel(channel) as channel:
             queue = self.topology.declare_delay_queue(
                 channel, queue_name, ignore_different_topology=True
             )
@@ -236,11 +337,11 @@ class KombuBroker(Broker):
         self.queues_pending.discard(queue_name)
         return queue
 
-    def _declare_xq_queue(self, queue_name):
+    def _declare_xq_queue(self, queue_name, channel=None):
         """DLX queue"""
-        queue_name = self.topology.get_dead_letter_queue_name(queue_name)
+        queue_name = self._get_queue_names(queue_name).dead_letter
 
-        with self.connection_holder.acquire_consumer_channel() as channel:
+        with self._maybe_acquire_channel(channel) as channel:
             queue = self.topology.declare_dead_letter_queue(
                 channel, queue_name, ignore_different_topology=True
             )
@@ -249,9 +350,23 @@ class KombuBroker(Broker):
         self.queues_pending.discard(queue_name)
         return queue
 
+    def _declare_pending_queues(self, queue_name, channel=None):
+        """Declare pending queues of canonical queue topology using one channel"""
+        q_names = self._get_queue_names(queue_name)
+
+        with self._maybe_acquire_channel(channel) as channel:
+            if q_names.delayed in self.queues_pending:
+                self._declare_dq_queue(q_names.canonical, channel=channel)
+
+            if q_names.dead_letter in self.queues_pending:
+                self._declare_xq_queue(q_names.canonical, channel=channel)
+
+            if q_names.canonical in self.queues_pending:
+                self._declare_queue(q_names.canonical, channel=channel)
+
     @classmethod
     def on_connection_error_errback(cls, exc, slept_interval):
-        logging.getLogger("KombuBroker").warning(
+        errback_logger.warning(
             "Broker connection error, trying again in %s seconds: %r.",
             slept_interval,
             exc,
@@ -271,7 +386,7 @@ class KombuBroker(Broker):
         cls.on_connection_error_errback(exc, next_sleep)
         return next_sleep
 
-    def _ensure_queue(self, queue_name):
+    def _ensure_queue(self, queue_name, channel=None):
         def _ensure(func, *args, **kwargs):
             try:
                 return self.connection_holder.retry_connection_errors_over_time(
@@ -283,73 +398,167 @@ class KombuBroker(Broker):
                 # support dramatiq RabbitMQ broker behaviour
                 raise dramatiq.errors.ConnectionClosed(exc.__cause__) from None
 
-        q_names = self.topology.get_queue_name_tuple(queue_name)
+        q_names = self._get_queue_names(queue_name)
         if queue_name != q_names.canonical:
             raise RuntimeError("You can ensure only canonical queue name. Given: %r" % queue_name)
 
+        if not self._is_queue_pending(q_names):
+            return
+
         if q_names.canonical in self.queues_pending:
             self.queues_pending.add(q_names.delayed)
             self.queues_pending.add(q_names.dead_letter)
 
-        if q_names.delayed in self.queues_pending:
-            _ensure(self._declare_dq_queue, q_names.canonical)
+        # given channel can be broken after connection error, retry with new one
+        channels = iter((channel,))
 
-        if q_names.dead_letter in self.queues_pending:
-            _ensure(self._declare_xq_queue, q_names.canonical)
+        def _declare_pending_queues():
+            # already declared queues are discarded from pending,
+            # so on retry only remaining ones are declared
+            self._declare_pending_queues(q_names.canonical, channel=next(channels, None))
 
-        if q_names.canonical in self.queues_pending:
-            _ensure(self._declare_queue, q_names.canonical)
+        _ensure(_declare_pending_queues)
 
     def enqueue(self, message, *, delay=None):  # pragma: no cover
         queue_name = message.queue_name
-        self.declare_queue(queue_name, ensure=True)
+        self._ensure_enqueue_queue(queue_name)
 
         if delay is not None:
-            queue_name = self.topology.get_delay_queue_name(queue_name)
-            message_eta = current_millis() + delay
-            message = message.copy(
-                queue_name=queue_name,
-                options={
-                    "eta": message_eta,
-                },
-            )
+            message = self._delay_message(message, delay)
+            queue_name = message.queue_name
 
         self.logger.debug("Enqueueing message %r on queue %r.", message.message_id, queue_name)
         self.emit_before("enqueue", message, delay)
 
+        # encode once, body reused when message published again after no-route error
+        body = message.encode()
+
         try:
-            self._enqueue_message(queue_name, message)
+            self._enqueue_message(queue_name, message, body=body)
         except amqp.exceptions.ChannelError as exc:
             if exc.reply_code != 312:  # 312 - no-route
                 raise
 
-            with self._declare_lock:
-                self.queues.discard(self.topology.get_canonical_queue_name(queue_name))
-                self.declare_queue(queue_name, ensure=True)
+            self._redeclare_queue(queue_name)
 
-            self._enqueue_message(queue_name, message)
+            self._enqueue_message(queue_name, message, body=body)
 
         self.emit_after("enqueue", message, delay)
         return message
 
-    def _enqueue_message(self, queue_name, message):
-        with self.connection_holder.acquire_producer(
+    def enqueue_many(self, messages: tp.Iterable[dramatiq.Message], *, delay=None) -> list:
+        """Enqueue several messages through one producer
+
+        Each queue is declared once and all messages are published using
+        the same producer (channel) instead of acquiring it per message.
+        With fast_publish=True each message is published as enqueue() does it,
+        acquiring producer per message.
+        With confirm_delivery=True each publish still waits for its confirm.
+
+        Returns
+        -------
+          list[Message]: enqueued messages, same as enqueue() return for each one
+        """
+        messages = list(messages)
+        for queue_name in dict.fromkeys(message.queue_name for message in messages):
+            self._ensure_enqueue_queue(queue_name)
+
+        enqueued = []
+        # fast publish acquires producer on each attempt itself
+        with (
+            contextlib.nullcontext() if self._fast_publish else self._acquire_producer()
+        ) as producer:
+            for message in messages:
+                if delay is not None:
+                    message = self._delay_message(message, delay)
+                queue_name = message.queue_name
+
+                self.logger.debug(
+                    "Enqueueing message %r on queue %r.", message.message_id, queue_name
+                )
+                self.emit_before("enqueue", message, delay)
+                body = message.encode()
+
+                try:
+                    self._publish_message(producer, queue_name, message, body)
+                except amqp.exceptions.ChannelError as exc:
+                    if exc.reply_code != 312:  # 312 - no-route
+                        raise
+
+                    self._redeclare_queue(queue_name)
+
+                    self._publish_message(producer, queue_name, message, body)
+
+                self.emit_after("enqueue", message, delay)
+                enqueued.append(message)
+
+        return enqueued
+
+    def _ensure_enqueue_queue(self, queue_name):
+        q_names = self._get_queue_names(queue_name)
+
+        # fast path: queue topology already declared on server
+        if q_names.canonical not in self.queues or self._is_queue_pending(q_names):
+            self.declare_queue(queue_name, ensure=True)
+
+    def _delay_message(self, message, delay):
+        """Return message copy targeted to delay queue"""
+        return message.copy(
+            queue_name=self._get_queue_names(message.queue_name).delayed,
+            options={
+                "eta": current_millis() + delay,
+            },
+        )
+
+    def _acquire_producer(self):
+        return self.connection_holder.acquire_producer(
             block=True,
             timeout=self._max_producer_acquire_timeout,
-        ) as producer:
-            return producer.publish(
-                exchange="",
-                routing_key=queue_name,
-                body=message.encode(),
-                delivery_mode=2,
+        )
+
+    def _enqueue_message(self, queue_name, message, *, body: tp.Optional[bytes] = None):
+        if body is None:
+            body = message.encode()
+
+        if self._fast_publish:
+            return self._fast_publish_message(queue_name, message, body)
+
+        with self._acquire_producer() as producer:
+            return self._producer_publish(producer, queue_name, message, body)
+
+    def _publish_message(self, producer, queue_name, message, body: bytes):
+        """Publish with given producer, or over own channel when fast_publish enabled"""
+        if self._fast_publish:
+            return self._fast_publish_message(queue_name, message, body)
+        return self._producer_publish(producer, queue_name, message, body)
+
+    def _producer_publish(self, producer, queue_name, message, body: bytes):
+        return producer.publish(
+            routing_key=queue_name,
+            body=body,
+            priority=message.options.get("broker_priority"),
+            **self._publish_options,
+        )
+
+    def _publish_on_channel(self, queue_name, message, body: bytes):
+        """Publish encoded message with channel.basic_publish
+
+        Same message as producer.publish() sends, but without kombu.Producer layers
+        (serializer/compression dispatch, exchange declaration, ensure wrapper).
+        """
+        with self._acquire_producer() as producer:
+            channel = producer.channel
+            amqp_message = channel.prepare_message(
+                body,
                 priority=message.options.get("broker_priority"),
-                retry=True,
-                retry_policy={
-                    "max_retries": self._max_enqueue_attempts,
-                    "errback": self.on_connection_error_errback,
-                },
-                # will raise amqp.exceptions.ChannelError(312, ...) when route not found (e.g.: queue not exists)
-                mandatory=True,
+                content_type="application/data",
+                content_encoding="binary",
+                headers={},
+                properties={"delivery_mode": 2},
+            )
+            # will raise amqp.exceptions.ChannelError(312, ...) when route not found (e.g.: queue not exists)
+            return channel.basic_publish(
+                amqp_message, exchange="", routing_key=queue_name, mandatory=True
             )
 
     def get_declared_queues(self):
@@ -362,50 +571,99 @@ class KombuBroker(Broker):
         """
         return self.queues.copy()
 
-    def flush(self, queue_name):
+    def flush(self, queue_name, *, channel=None):
         """Drop all the messages from a queue.
 
         Parameters
         ----------
           queue_name(str): The queue to flush.
+          channel: already acquired channel to purge queues with.
         """
-        q_names = self.topology.get_queue_name_tuple(queue_name)
+        if queue_name in self.queues_pending:
+            return
 
-        with self.connection_holder.acquire_consumer_channel() as channel:
+        q_names = self._get_queue_names(queue_name)
+
+        with self._maybe_acquire_channel(channel) as channel:
             for name in (q_names.canonical, q_names.delayed, q_names.dead_letter):
-                if queue_name not in self.queues_pending:
+                # not declared on server yet, purge will fail and close the channel
+                if name not in self.queues_pending:
                     channel.queue_purge(name)
 
     def flush_all(self):
         """Drop all messages from all declared queues."""
-        for queue_name in self.queues:
-            self.flush(queue_name)
+        canonical_names = self._get_canonical_queue_names()
+        if not canonical_names:
+            return
+
+        self._each_queue_over_channel(canonical_names, self.flush)
+
+    def _get_canonical_queue_names(self, include_pending: bool = False) -> set[str]:
+        """Canonical names of known queues; .DQ and .XQ names are folded into them"""
+        # iterate snapshots, declare may happen concurrently
+        return {
+            self._get_queue_names(queue_name).canonical
+            for queue_name in itertools.chain(
+                tuple(self.queues),
+                tuple(self.queues_pending) if include_pending else (),
+            )
+        }
 
-    def delete_queue(self, queue_name, if_unused: bool = False, if_empty: bool = False):
-        q_names = self.topology.get_queue_name_tuple(queue_name)
+    def delete_queue(
+        self,
+        queue_name,
+        if_unused: bool = False,
+        if_empty: bool = False,
+        *,
+        channel=None,
+    ):
+        q_names = self._get_queue_names(queue_name)
 
         with self._declare_lock:
             for name in (q_names.canonical, q_names.delayed, q_names.dead_letter):
                 with (
                     contextlib.suppress(amqp.exceptions.NotAllowed),
-                    self.connection_holder.acquire_consumer_channel() as channel,
+                    self._maybe_acquire_channel(channel) as delete_channel,
                 ):
-                    channel.queue_delete(name, if_unused=if_unused, if_empty=if_empty)
+                    delete_channel.queue_delete(name, if_unused=if_unused, if_empty=if_empty)
 
-            self.queues.discard(queue_name)
-            self.queues_pending.add(queue_name)
+                if channel is not None and not _is_channel_open(channel):
+                    channel = None  # closed by suppressed error, acquire own channels for the rest
+
+            self.queues.difference_update(q_names)
+            self.queues_pending.add(q_names.canonical)
 
     def delete_all(self, include_pending: bool = False):
-        queues = self.queues.copy()
+        # .DQ and .XQ are deleted along with canonical queue, delete each topology once
+        canonical_names = self._get_canonical_queue_names(include_pending)
+
+        if not canonical_names:
+            return
+
+        self._each_queue_over_channel(canonical_names, self.delete_queue)
+
+    def _each_queue_over_channel(self, queue_names, func) -> None:
+        """Call func(queue_name, channel=channel) for each queue, reusing one channel
 
-        if include_pending:
-            queues |= self.queues_pending
+        Errors suppressed by func (e.g. NotAllowed on delete) may close the channel,
+        then it is released and the next queue gets a new one.
+        """
+        channel = None
+        try:
+            for queue_name in queue_names:
+                if channel is None:
+                    channel = self.connection_holder.acquire_consumer_channel()
 
-        for queue_name in queues:
-            self.delete_queue(queue_name)
+                func(queue_name, channel=channel)
+
+                if not _is_channel_open(channel):
+                    closed_channel, channel = channel, None
+                    closed_channel.release()
+        finally:
+            if channel is not None:
+                channel.release()
 
     def consume(self, queue_name, prefetch=1, timeout=5000):
-        timeout = dt.timedelta(milliseconds=timeout)
         consumer = self.DramatiqConsumer(
             self.connection_holder.acquire_consumer_channel(),
             queue_name,
@@ -418,9 +676,7 @@ class KombuBroker(Broker):
             consumer.check()
         except amqp.exceptions.NotFound:
             self.logger.info("Queue %s does not exists, ensure declaring", queue_name)
-            with self._declare_lock:
-                self.queues.discard(queue_name)
-                self.declare_queue(queue_name, ensure=True)
+            self._redeclare_queue(queue_name)
         else:
             with self._declare_lock:
                 self.queues_pending.discard(queue_name)
@@ -1,5 +1,4 @@
 import abc
-import contextlib
 import functools
 import logging
 import typing as tp
@@ -14,8 +13,8 @@ if tp.TYPE_CHECKING:
 
 
 class ConnectionHolder(abc.ABC):
-    recoverable_connection_errors: tuple[Exception, ...]
-    recoverable_channel_errors: tuple[Exception, ...]
+    recoverable_connection_errors: tuple[type[Exception], ...]
+    recoverable_channel_errors: tuple[type[Exception], ...]
     connect_max_retries: tp.Optional[int]
     logger: logging.Logger
 
@@ -55,20 +54,19 @@ class ConnectionHolder(abc.ABC):
 
         return _retry
 
-    @contextlib.contextmanager
     def reraise_as_library_errors(
         self,
         ConnectionError=dramatiq.ConnectionError,  # noqa: N803,A002
         ChannelError=dramatiq.ConnectionError,  # noqa: N803
-    ):
-        try:
-            yield
-        except (ConnectionError, ChannelError):
-            raise
-        except self.recoverable_connection_errors as exc:
-            raise ConnectionError(str(exc)) from exc
-        except self.recoverable_channel_errors as exc:
-            raise ChannelError(str(exc)) from exc
+    ) -> "ReraiseAsLibraryErrors":
+        if ConnectionError is dramatiq.ConnectionError and ChannelError is dramatiq.ConnectionError:
+            return self._reraise_as_library_errors
+        return ReraiseAsLibraryErrors(self, ConnectionError, ChannelError)
+
+    @functools.cached_property
+    def _reraise_as_library_errors(self) -> "ReraiseAsLibraryErrors":
+        # stateless, can be shared between calls and threads
+        return ReraiseAsLibraryErrors(self, dramatiq.ConnectionError, dramatiq.ConnectionError)
 
     def on_connection_error_errback(self, exc, slept_interval):
         self.logger.warning(
@@ -93,3 +91,35 @@ class ConnectionHolder(abc.ABC):
     @abc.abstractmethod
     def close(self):
         raise NotImplementedError
+
+
+class ReraiseAsLibraryErrors:
+    """Convert kombu connection and channel errors to dramatiq errors
+
+    Plain class instead of @contextmanager: no generator created on each use
+    """
+
+    __slots__ = ("_channel_error", "_connection_error", "_holder")
+
+    def __init__(
+        self,
+        holder: ConnectionHolder,
+        connection_error: type[Exception],
+        channel_error: type[Exception],
+    ):
+        self._holder = holder
+        self._connection_error = connection_error
+        self._channel_error = channel_error
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            return
+        if isinstance(exc, (self._connection_error, self._channel_error)):
+            return
+        if isinstance(exc, self._holder.recoverable_connection_errors):
+            raise self._connection_error(str(exc)) from exc
+        if isinstance(exc, self._holder.recoverable_channel_errors):
+            raise self._channel_error(str(exc)) from exc
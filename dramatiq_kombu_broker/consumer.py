@@ -1,7 +1,6 @@
-import collections
 import contextlib
 import datetime as dt
-import functools
+import queue
 import threading
 import typing as tp
 
@@ -16,7 +15,8 @@ from kombu.transport.virtual import Channel
 from kombu.utils.debug import Logwrapped
 from kombu_pyamqp_threadsafe import ThreadSafeChannel
 
-from ._types import ReleasableChannel
+if tp.TYPE_CHECKING:
+    from ._types import ReleasableChannel
 
 
 class QueueReader(kombu.simple.SimpleBase):
@@ -139,12 +139,16 @@ class DramatiqConsumer(BaseConsumer):
 
     def __init__(
         self,
-        channel: ReleasableChannel,
+        channel: "ReleasableChannel",
         queue_name: str,
         prefetch_count: int,
-        read_timeout: dt.timedelta,
+        read_timeout: tp.Union[dt.timedelta, int],
         blocking_acknowledge: bool = False,
     ):
+        """
+        :param read_timeout: how long to wait for message,
+            timedelta or milliseconds (as dramatiq pass to Broker.consume)
+        """
         connection = channel.connection
         if connection is None:
             raise RecoverableConnectionError("connection already closed") from None
@@ -155,20 +159,33 @@ class DramatiqConsumer(BaseConsumer):
             prefetch_count=prefetch_count,
         )
         self.__connection__: kombu.Connection = connection.client
-        self._ack_queue: collections.deque = collections.deque()
-        self._nack_queue: collections.deque = collections.deque()
+        self._conn_errors: tuple = tuple(self.__connection__.connection_errors) + tuple(
+            self.__connection__.channel_errors
+        )
+        #: (ack or nack function, message, done event) to be processed in consumer thread, in order
+        self._acknowledge_queue: queue.SimpleQueue = queue.SimpleQueue()
+        #: reusable done events for blocking acknowledge
+        self._done_events: queue.SimpleQueue = queue.SimpleQueue()
 
         self._owner_id = threading.get_ident()
 
         self.channel = channel
         self.read_timeout = read_timeout
+        if isinstance(read_timeout, dt.timedelta):
+            self._read_timeout_seconds = read_timeout.total_seconds()
+        else:
+            self._read_timeout_seconds = read_timeout / 1000
+        heartbeat = self.__connection__.heartbeat
+        if heartbeat:
+            # heartbeat_check() called only when read timed out, wake up often enough to send heartbeats
+            self._read_timeout_seconds = min(self._read_timeout_seconds, heartbeat / 2)
         self.blocking_acknowledge = blocking_acknowledge
         self.logger = get_logger(self.__module__, f"{self.__class__.__name__}({queue_name})")
 
     def _is_threadsafe(self):
         """Check operation can be applied in current thread"""
         return self.channel_threadsafe or (
-            threading.current_thread().ident
+            threading.get_ident()
             == self._owner_id  # we are in ConsumerThread, protect from deadlock
         )
 
@@ -196,11 +213,22 @@ class DramatiqConsumer(BaseConsumer):
             return
 
         if not block:
-            self._ack_queue.append((message, None))
+            self._acknowledge_queue.put((self._ack_or_log_error, message, None))
         else:
+            self._wait_acknowledge(self._ack_or_log_error, message, timeout)
+
+    def _wait_acknowledge(self, acknowledge, message, timeout: tp.Optional[float]) -> None:
+        """Pass acknowledge to consumer thread and wait until it done"""
+        try:
+            done = self._done_events.get_nowait()
+        except queue.Empty:
             done = threading.Event()
-            self._ack_queue.append((message, done))
-            done.wait(timeout)
+
+        self._acknowledge_queue.put((acknowledge, message, done))
+        if done.wait(timeout):
+            done.clear()
+            self._done_events.put(done)
+        # on timeout event can be set later, do not reuse it
 
     def _nack_or_log_error(self, message: MessageProxy) -> None:  # type: ignore[valid-type]
         try:
@@ -223,11 +251,9 @@ class DramatiqConsumer(BaseConsumer):
             return
 
         if not block:
-            self._nack_queue.append((message, None))
+            self._acknowledge_queue.put((self._nack_or_log_error, message, None))
         else:
-            done = threading.Event()
-            self._nack_queue.append((message, done))
-            done.wait(timeout)
+            self._wait_acknowledge(self._nack_or_log_error, message, timeout)
 
     def close(self):
         with contextlib.suppress(Exception):
@@ -237,34 +263,24 @@ class DramatiqConsumer(BaseConsumer):
         with contextlib.suppress(Exception):
             self.channel.release()
 
-    @functools.cached_property
-    def _conn_errors(self) -> tuple:
-        return tuple(self.__connection__.connection_errors) + tuple(
-            self.__connection__.channel_errors
-        )
-
-    def _process_queued_ack_events(self):
-        while self._ack_queue:
-            message, done_event = self._ack_queue.popleft()
-            self._ack_or_log_error(message)
-            if done_event is not None:
-                done_event.set()
+    def _process_queued_acknowledge_events(self):
+        while True:
+            try:
+                acknowledge, message, done_event = self._acknowledge_queue.get_nowait()
+            except queue.Empty:
+                return
 
-    def _process_queued_nack_events(self):
-        while self._nack_queue:
-            message, done_event = self._nack_queue.popleft()
-            self._nack_or_log_error(message)
+            acknowledge(message)
             if done_event is not None:
                 done_event.set()
 
     def __next__(self) -> tp.Optional[MessageProxy]:  # type: ignore[valid-type]
         """Consume message from RMQ and return it"""
         try:
-            self._process_queued_ack_events()
-            self._process_queued_nack_events()
+            self._process_queued_acknowledge_events()
 
             message: tp.Optional[kombu.Message] = self._reader.pop(
-                timeout=self.read_timeout.total_seconds()
+                timeout=self._read_timeout_seconds
             )
             if message is None:
                 conn = self.channel.connection
@@ -305,6 +321,32 @@ class ThreadSafeDramatiqConsumer(DramatiqConsumer):
         if not isinstance(channel, ThreadSafeChannel):
             raise ValueError("Channel must be ThreadSafeChannel")
 
+    # channel can be used from any thread, no need to check _is_threadsafe()
+
+    def ack(
+        self,
+        message: MessageProxy,  # type: ignore[valid-type]
+        *,
+        block: tp.Optional[bool] = None,
+        timeout: tp.Optional[float] = None,
+    ):
+        if block or (block is None and self.blocking_acknowledge):
+            self._ack_or_log_error(message)
+        else:
+            self._acknowledge_queue.put((self._ack_or_log_error, message, None))
+
+    def nack(
+        self,
+        message: MessageProxy,  # type: ignore[valid-type]
+        *,
+        block: tp.Optional[bool] = None,
+        timeout: tp.Optional[float] = None,
+    ):
+        if block or (block is None and self.blocking_acknowledge):
+            self._nack_or_log_error(message)
+        else:
+            self._acknowledge_queue.put((self._nack_or_log_error, message, None))
+
 
 class GeventDramatiqConsumer(ThreadSafeDramatiqConsumer):
     """Gevent-compatible Dramatiq consumer
@@ -0,0 +1,12 @@
+import dramatiq
+
+
+class DeclareQueuesOnBoot(dramatiq.Middleware):
+    """Declare queues of all known actors before worker starts consuming
+
+    Without it each queue is declared on server on first enqueue or consume.
+    Works only with KombuBroker.
+    """
+
+    def before_worker_boot(self, broker, worker):
+        broker.declare_pending_queues()
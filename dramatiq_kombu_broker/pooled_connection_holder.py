@@ -19,6 +19,8 @@ class AutoConnectionReleaseChannel:
     .release() method just return Connection to their pool instead closing the channel
     """
 
+    __slots__ = ("__connection", "__channel")
+
     def __init__(self, connection: kombu.Connection):
         super().__setattr__("_AutoConnectionReleaseChannel__connection", connection)
         super().__setattr__("_AutoConnectionReleaseChannel__channel", connection.default_channel)
@@ -68,6 +70,11 @@ class PooledConnectionHolder(ConnectionHolder):
         self._producer_conn_pool: ConnectionPool = kombu.pools.register_group(
             kombu.pools.Connections(limit=producer_pool_size)
         )[connection]
+        # ProducerPool do all required stuff,
+        # e.g: acquire connection and return it to pool when Producer.release() called
+        self._producer_pool = kombu.pools.ProducerPool(
+            self._producer_conn_pool, limit=producer_pool_size
+        )
 
         self._setup_lock = threading.Lock()
 
@@ -80,7 +87,8 @@ class PooledConnectionHolder(ConnectionHolder):
         self, ensure: bool = True, block=True, timeout=None
     ) -> kombu.Connection:
         conn = self._consumer_conn_pool.acquire(block=block, timeout=timeout)
-        if ensure:
+        # usually pooled connection already connected, skip ensure_connection machinery
+        if ensure and not conn.connected:
             conn.ensure_connection(
                 errback=self.on_connection_error_errback,
                 max_retries=self.connect_max_retries,
@@ -96,14 +104,12 @@ class PooledConnectionHolder(ConnectionHolder):
 
         You MUST call .release() manually, or use context-manager
         """
-        # ProducerPool do all required stuff,
-        # e.g: acquire connection and return it to pool when Producer.release() called
-        pool = kombu.pools.ProducerPool(self._producer_conn_pool)
-        producer = pool.acquire(block=block, timeout=timeout)
-        producer.connection.ensure_connection(
-            errback=self.on_connection_error_errback,
-            max_retries=self.connect_max_retries,
-        )
+        producer = self._producer_pool.acquire(block=block, timeout=timeout)
+        if not producer.connection.connected:
+            producer.connection.ensure_connection(
+                errback=self.on_connection_error_errback,
+                max_retries=self.connect_max_retries,
+            )
         return producer
 
     def close(self):
@@ -116,6 +122,14 @@ class PooledConnectionHolder(ConnectionHolder):
             # https://github.com/celery/kombu/issues/2018
             self._consumer_conn_pool._closed = False
 
+            self._producer_pool.resize(
+                limit=self._producer_pool.limit,
+                reset=True,
+                ignore_errors=True,
+            )
+            # https://github.com/celery/kombu/issues/2018
+            self._producer_pool._closed = False
+
             self._producer_conn_pool.resize(
                 limit=self._producer_conn_pool.limit,
                 reset=True,
@@ -20,6 +20,7 @@ class SharedConnectionHolder(ConnectionHolder):
         consumer_channel_pool_size: int = 100,
         producer_channel_pool_size: int = 100,
         connect_max_retries=None,
+        single_connection: bool = False,
     ):
         """
         :param connection: connection info
@@ -27,16 +28,23 @@ class SharedConnectionHolder(ConnectionHolder):
         :param producer_channel_pool_size: maximum number of channels created in producer connection (default: 100)
         :param connect_max_retries: maximum number of retries trying to re-establish the connection,
             if the connection is lost/unavailable.
+        :param single_connection: consume and produce through one connection
+            with channel pool of both sizes sum (default: separate connections)
         """
         connection = SharedKombuConnection.from_kombu_connection(connection)
 
-        self._consumer_connection = connection.clone(
-            default_channel_pool_size=consumer_channel_pool_size
-        )
-        self._producer_connection = connection.clone(
-            default_channel_pool_size=producer_channel_pool_size
-        )
-        self._conn_lock = threading.RLock()
+        if single_connection:
+            self._consumer_connection = self._producer_connection = connection.clone(
+                default_channel_pool_size=consumer_channel_pool_size + producer_channel_pool_size
+            )
+        else:
+            self._consumer_connection = connection.clone(
+                default_channel_pool_size=consumer_channel_pool_size
+            )
+            self._producer_connection = connection.clone(
+                default_channel_pool_size=producer_channel_pool_size
+            )
+        self._conn_lock = threading.Lock()  # not reentrant, guards only ensure/reconnect calls
         self._consumer_channel_pool = None
         self._producer_channel_pool = None
 
@@ -45,6 +53,44 @@ class SharedConnectionHolder(ConnectionHolder):
         self.connect_max_retries = connect_max_retries
         self.logger = logger.getChild(self.__class__.__name__)
 
+        # built once, reused by each acquire
+        self._acquire_producer_channel = self._ensured_channel_acquire(self._producer_connection)
+        self._acquire_consumer_channel = self._ensured_channel_acquire(self._consumer_connection)
+
+    def _ensured_channel_acquire(
+        self, conn: SharedKombuConnection
+    ) -> tp.Callable[..., ThreadSafeChannel]:
+        """Return channel pool acquire function, which re-establish connection on errors"""
+
+        def _acquire_channel(block: bool, timeout: tp.Optional[float]) -> ThreadSafeChannel:
+            # pool is re-created on reconnect, get actual one each time
+            return conn.default_channel_pool.acquire(block=block, timeout=timeout)
+
+        return conn.ensure(
+            conn,
+            _acquire_channel,
+            errback=self.on_connection_error_errback,
+            max_retries=self.connect_max_retries,
+        )
+
+    def _acquire_channel(
+        self,
+        conn: SharedKombuConnection,
+        ensured_acquire: tp.Callable[..., ThreadSafeChannel],
+        block: bool,
+        timeout: tp.Optional[float],
+    ) -> ThreadSafeChannel:
+        """Acquire channel from connection pool, re-establish connection under the lock"""
+        if conn.connected:
+            # fast path: pool acquire is thread-safe, no lock while connection alive
+            try:
+                return conn.default_channel_pool.acquire(block=block, timeout=timeout)
+            except self.recoverable_connection_errors:
+                pass  # connection lost, reconnect below
+
+        with self._conn_lock:  # ensure is not thread-safe, reconnect only by one thread
+            return ensured_acquire(block=block, timeout=timeout)
+
     def _get_consumer_connection(self, ensure: bool = True) -> SharedKombuConnection:
         conn = self._consumer_connection
 
@@ -74,17 +120,11 @@ class SharedConnectionHolder(ConnectionHolder):
 
         You MUST call `.release()` manually or use context-manager
         """
-        with self._conn_lock:
-            conn = self._get_producer_connection(ensure=False)
-            acquire = conn.ensure(  # TODO: make ensure threadsafe + use self._conn_lock on ensure
-                conn,
-                lambda *a, **kw: conn.default_channel_pool.acquire(*a, **kw),
-                errback=self.on_connection_error_errback,
-                max_retries=self.connect_max_retries,
-            )
-            channel = acquire(block=block, timeout=timeout)
-            assert channel.is_open
-            return AutoChannelReleaseProducer(channel)
+        channel = self._acquire_channel(
+            self._producer_connection, self._acquire_producer_channel, block, timeout
+        )
+        assert channel.is_open
+        return AutoChannelReleaseProducer(channel)
 
     def acquire_consumer_channel(
         self,
@@ -95,17 +135,11 @@ class SharedConnectionHolder(ConnectionHolder):
 
         You MUST call `.release()` manually or use context-manager
         """
-        with self._conn_lock:
-            conn = self._get_consumer_connection(ensure=False)
-            acquire = conn.ensure(
-                conn,
-                lambda *a, **kw: conn.default_channel_pool.acquire(*a, **kw),
-                errback=self.on_connection_error_errback,
-                max_retries=self.connect_max_retries,
-            )
-            channel = acquire(block=block, timeout=timeout)
-            assert channel.is_open
-            return channel
+        channel = self._acquire_channel(
+            self._consumer_connection, self._acquire_consumer_channel, block, timeout
+        )
+        assert channel.is_open
+        return channel
 
     def close(self) -> None:
         if self._consumer_connection.connected:
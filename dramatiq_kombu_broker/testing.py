@@ -6,7 +6,8 @@ from . import ConnectionPooledKombuBroker, ConnectionSharedKombuBroker
 
 
 def get_kombu_resource_objects(resource: kombu.resource.Resource) -> list:
-    return list(resource._dirty) + [r for r in resource._resource.queue if not isinstance(r, lazy)]
+    # lazy objects in queue are not created yet
+    return [*resource._dirty, *(r for r in resource._resource.queue if not isinstance(r, lazy))]
 
 
 def ensure_consumer_connection_rabbitmq(broker):
@@ -19,17 +20,35 @@ def ensure_producer_conneciton_rabbitmq(broker):
         assert producer.connection.connected
 
 
-def get_consumer_connections(broker):
-    if isinstance(broker, ConnectionSharedKombuBroker):
-        return [broker.connection_holder._consumer_connection]
-
-    if isinstance(broker, ConnectionPooledKombuBroker):
-        resource = broker.connection_holder._consumer_conn_pool
-        return get_kombu_resource_objects(resource)
+def _get_broker_connections(getters: dict, broker) -> list:
+    # exact broker class found by first lookup, subclasses resolved by MRO
+    for broker_cls in type(broker).__mro__:
+        getter = getters.get(broker_cls)
+        if getter is not None:
+            return getter(broker)
 
     raise TypeError(broker.__class__.__name__)
 
 
+_consumer_connections_getters = {
+    ConnectionSharedKombuBroker: lambda broker: [broker.connection_holder._consumer_connection],
+    ConnectionPooledKombuBroker: lambda broker: get_kombu_resource_objects(
+        broker.connection_holder._consumer_conn_pool
+    ),
+}
+
+_producer_connections_getters = {
+    ConnectionSharedKombuBroker: lambda broker: [broker.connection_holder._producer_connection],
+    ConnectionPooledKombuBroker: lambda broker: get_kombu_resource_objects(
+        broker.connection_holder._producer_conn_pool
+    ),
+}
+
+
+def get_consumer_connections(broker):
+    return _get_broker_connections(_consumer_connections_getters, broker)
+
+
 def assert_consumer_connections_one(broker) -> kombu.Connection:
     connections = get_consumer_connections(broker)
     assert len(connections) == 1
@@ -37,11 +56,4 @@ def assert_consumer_connections_one(broker) -> kombu.Connection:
 
 
 def get_producer_connections(broker):
-    if isinstance(broker, ConnectionSharedKombuBroker):
-        return [broker.connection_holder._producer_connection]
-
-    if isinstance(broker, ConnectionPooledKombuBroker):
-        resource = broker.connection_holder._producer_conn_pool
-        return get_kombu_resource_objects(resource)
-
-    raise TypeError(broker.__class__.__name__)
+    return _get_broker_connections(_producer_connections_getters, broker)
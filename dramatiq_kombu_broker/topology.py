@@ -1,13 +1,13 @@
 import dataclasses
 import datetime as dt
-import functools
 import logging
 import os
+import sys
 import typing as tp
 
 import amqp.exceptions
-import dramatiq.common
 import kombu
+from dramatiq.common import dq_name, q_name, xq_name
 from kombu.transport.virtual import Channel
 
 module_logger = logging.getLogger(__name__)
@@ -23,6 +23,11 @@ class QueueName(tp.NamedTuple):
     dead_letter: str
 
 
+#: (topology class, queue name) -> names; dropped whole when full, bounds dynamic queue names
+_queue_name_tuples: dict[tuple[type, str], QueueName] = {}
+_queue_name_tuples_maxsize = 4096
+
+
 @dataclasses.dataclass
 class DefaultDramatiqTopology:
     logger: logging.Logger = module_logger.getChild("Topology")
@@ -34,7 +39,6 @@ class DefaultDramatiqTopology:
     dead_letter_message_ttl: tp.Optional[dt.timedelta] = dramatiq_rabbitmq_dlq_ttl
 
     @classmethod
-    @functools.lru_cache
     def get_queue_name_tuple(cls, queue_name: str) -> QueueName:
         """Fast shortcut to get all queue name varaiants
 
@@ -42,15 +46,27 @@ class DefaultDramatiqTopology:
         :return: named tuple with names, (canonical, delayed, dead_letter)
         Names can be accessed via attribute
         """
-        canonical_name = cls.get_canonical_queue_name(queue_name)
-        delay_name = cls.get_delay_queue_name(queue_name)
-        dlq_name = cls.get_dead_letter_queue_name(queue_name)
-        return QueueName(canonical_name, delay_name, dlq_name)
+        key = (cls, queue_name)
+        try:
+            return _queue_name_tuples[key]
+        except KeyError:
+            pass
+
+        # interned names make set lookups of broker queues compare by identity
+        canonical_name = sys.intern(cls.get_canonical_queue_name(queue_name))
+        delay_name = sys.intern(cls.get_delay_queue_name(queue_name))
+        dlq_name = sys.intern(cls.get_dead_letter_queue_name(queue_name))
+        q_names = QueueName(canonical_name, delay_name, dlq_name)
+
+        if len(_queue_name_tuples) >= _queue_name_tuples_maxsize:
+            _queue_name_tuples.clear()
+        _queue_name_tuples[key] = q_names
+        return q_names
 
     @classmethod
     def get_canonical_queue_name(cls, queue_name):
         """Returns the canonical queue name for a given queue."""
-        return dramatiq.common.q_name(queue_name)
+        return q_name(queue_name)
 
     @classmethod
     def get_dead_letter_queue_name(cls, queue_name):
@@ -58,7 +74,7 @@ class DefaultDramatiqTopology:
         given queue name belongs to a delayed queue, the dead letter queue
         name for the original queue is generated.
         """
-        return dramatiq.common.xq_name(queue_name)
+        return xq_name(queue_name)
 
     @classmethod
     def get_delay_queue_name(cls, queue_name):
@@ -66,18 +82,16 @@ class DefaultDramatiqTopology:
         queue name already belongs to a delayed queue, then it is returned
         unchanged.
         """
-        return dramatiq.common.dq_name(queue_name)
+        return dq_name(queue_name)
 
     def _get_canonical_queue_arguments(self, queue_name: str, dlx: bool = True) -> dict:
-        queue_arguments = {}
-
         if dlx:
-            queue_arguments.update(
-                {
-                    "x-dead-letter-exchange": self.dlx_exchange_name,
-                    "x-dead-letter-routing-key": self.get_dead_letter_queue_name(queue_name),
-                }
-            )
+            queue_arguments = {
+                "x-dead-letter-exchange": self.dlx_exchange_name,
+                "x-dead-letter-routing-key": self.get_dead_letter_queue_name(queue_name),
+            }
+        else:
+            queue_arguments = {}
 
         if self.max_priority:
             queue_arguments["x-max-priority"] = self.max_priority
@@ -117,7 +131,16 @@ class DefaultDramatiqTopology:
         self.logger.info("Declare queue %r (channel=%r)", queue_name, channel.channel_id)
 
         try:
-            queue.declare()
+            # same as queue.declare() does for queue without exchange, but skip kombu entity layers
+            channel.queue_declare(
+                queue=queue_name,
+                passive=False,
+                durable=self.durable,
+                exclusive=False,
+                auto_delete=self.auto_delete,
+                arguments=channel.prepare_queue_arguments(queue_arguments),
+                nowait=False,
+            )
         except amqp.exceptions.PreconditionFailed as exc:
             if not ignore_different_topology:
                 raise
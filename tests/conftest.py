@@ -1,4 +1,8 @@
+import base64
+import json
 import os
+import urllib.parse
+import urllib.request
 
 import pytest
 
@@ -8,17 +12,17 @@ pytest_plugins = [
 ]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def rabbitmq_username():
     return "guest"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def rabbitmq_password():
     return "guest"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def rabbitmq_hostname():
     if hostname := os.getenv("PYTEST_RABBITMQ_HOST"):
         return hostname
@@ -26,7 +30,7 @@ def rabbitmq_hostname():
     return "127.0.0.1"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def rabbitmq_port():
     if port := os.getenv("PYTEST_RABBITMQ_PORT"):
         return int(port)
@@ -34,6 +38,59 @@ def rabbitmq_port():
     return 5672
 
 
+@pytest.fixture(scope="session")
+def rabbitmq_management_port():
+    if port := os.getenv("PYTEST_RABBITMQ_MANAGEMENT_PORT"):
+        return int(port)
+
+    return 15672
+
+
+def _rabbitmq_management_request(url, method, username, password, body=None):
+    data = None if body is None else json.dumps(body).encode()
+    request = urllib.request.Request(url, data=data, method=method)
+    request.add_header("Content-Type", "application/json")
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    request.add_header("Authorization", f"Basic {credentials}")
+    with urllib.request.urlopen(request, timeout=10):
+        pass
+
+
+@pytest.fixture(scope="session")
+def rabbitmq_vhost(
+    rabbitmq_username, rabbitmq_password, rabbitmq_hostname, rabbitmq_management_port
+):
+    """Isolated vhost per pytest-xdist worker, default vhost otherwise.
+
+    Run the suite with `pytest -n auto`: every worker gets its own `test_gwN` vhost
+    (created with the management API), so workers never see each other's queues.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        yield "/"
+        return
+
+    vhost = f"test_{worker}"
+    api_url = f"http://{rabbitmq_hostname}:{rabbitmq_management_port}/api"
+    vhost_quoted = urllib.parse.quote(vhost, safe="")
+    vhost_url = f"{api_url}/vhosts/{vhost_quoted}"
+    permissions_url = f"{api_url}/permissions/{vhost_quoted}/{rabbitmq_username}"
+
+    _rabbitmq_management_request(vhost_url, "PUT", rabbitmq_username, rabbitmq_password)
+    _rabbitmq_management_request(
+        permissions_url,
+        "PUT",
+        rabbitmq_username,
+        rabbitmq_password,
+        body={"configure": ".*", "write": ".*", "read": ".*"},
+    )
+    yield vhost
+    _rabbitmq_management_request(vhost_url, "DELETE", rabbitmq_username, rabbitmq_password)
+
+
 @pytest.fixture()
-def rabbitmq_dsn(rabbitmq_username, rabbitmq_password, rabbitmq_hostname, rabbitmq_port):
-    return f"amqp://{rabbitmq_username}:{rabbitmq_password}@{rabbitmq_hostname}:{rabbitmq_port}/"
+def rabbitmq_dsn(
+    rabbitmq_username, rabbitmq_password, rabbitmq_hostname, rabbitmq_port, rabbitmq_vhost
+):
+    vhost = "" if rabbitmq_vhost == "/" else urllib.parse.quote(rabbitmq_vhost, safe="")
+    return f"amqp://{rabbitmq_username}:{rabbitmq_password}@{rabbitmq_hostname}:{rabbitmq_port}/{vhost}"
@@ -25,6 +25,12 @@ def kombu_max_priority(request):
     return request.param
 
 
+@pytest.fixture(params=[False])
+def kombu_fast_publish(request):
+    assert isinstance(request.param, bool)
+    return request.param
+
+
 @pytest.fixture(params=[None])
 def kombu_broker_connection_holder_options(request) -> dict:
     if request.param is None:
@@ -32,7 +38,25 @@ def kombu_broker_connection_holder_options(request) -> dict:
     return request.param
 
 
-@pytest.fixture(params=["conn-pool", "conn-share"])
+def make_message(queue_name: str, **options) -> dramatiq.Message:
+    """Message of not declared actor, enough to enqueue it and read back"""
+    return dramatiq.Message(
+        queue_name=queue_name,
+        actor_name="some-actor",
+        args=(),
+        kwargs={},
+        options=options,
+    )
+
+
+# broker-agnostic tests run once with the shared connection,
+# connection handling tests are marked to run with every connection holder
+parametrize_all_kombu_broker_cls = pytest.mark.parametrize(
+    "kombu_broker_cls", ["conn-pool", "conn-share"], indirect=True
+)
+
+
+@pytest.fixture(params=["conn-share"])
 def kombu_broker_cls(request):
     if request.param == "conn-pool":
         return ConnectionPooledKombuBroker
@@ -49,6 +73,7 @@ def kombu_broker(
     kombu_max_declare_attempts,
     kombu_max_enqueue_attempts,
     kombu_max_priority,
+    kombu_fast_publish,
     kombu_broker_cls,
     kombu_broker_connection_holder_options,
 ):
@@ -57,6 +82,7 @@ def kombu_broker(
         max_declare_attempts=kombu_max_declare_attempts,
         max_enqueue_attempts=kombu_max_enqueue_attempts,
         max_priority=kombu_max_priority,
+        fast_publish=kombu_fast_publish,
         connection_holder_options=kombu_broker_connection_holder_options,
     )
     ensure_consumer_connection_rabbitmq(broker)
@@ -69,9 +95,15 @@ def kombu_broker(
     broker.close()
 
 
+@pytest.fixture(params=[1])
+def kombu_worker_threads(request):
+    assert isinstance(request.param, int)
+    return request.param
+
+
 @pytest.fixture()
-def kombu_worker(kombu_broker):
-    worker = Worker(kombu_broker, worker_threads=2)
+def kombu_worker(kombu_broker, kombu_worker_threads):
+    worker = Worker(kombu_broker, worker_threads=kombu_worker_threads)
     worker.start()
     yield worker
     worker.stop()
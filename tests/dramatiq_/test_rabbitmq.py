@@ -27,6 +27,8 @@ from dramatiq_kombu_broker.testing import (
     get_producer_connections,
 )
 
+from tests.conftest_kombu_broker import parametrize_all_kombu_broker_cls
+
 
 def assert_producer_connections_one(broker) -> kombu.Connection:
     connections = get_producer_connections(broker)
@@ -34,6 +36,27 @@ def assert_producer_connections_one(broker) -> kombu.Connection:
     return connections[0]
 
 
+class DeclaredMiddleware(Middleware):
+    def __init__(self, queue_name, declared_ev):
+        self.queue_name = queue_name
+        self.declared_ev = declared_ev
+
+    def after_declare_queue(self, broker, queue_name):
+        if queue_name == self.queue_name:
+            self.declared_ev.set()
+
+
+class BadEncoder(dramatiq.JSONEncoder):
+    def __init__(self, xfail_token):
+        self.xfail_token = xfail_token
+
+    def decode(self, data):
+        if self.xfail_token in str(data):
+            raise RuntimeError(self.xfail_token)
+        return super().decode(data)
+
+
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker_can_be_passed_a_semicolon_separated_list_of_uris(
     rabbitmq_dsn,
     kombu_broker_cls,
@@ -55,6 +78,8 @@ def test_kombu_broker_can_be_passed_a_semicolon_separated_list_of_uris(
     assert connection.alt == ["amqp://127.0.0.1:55672", rabbitmq_dsn]
 
 
+@parametrize_all_kombu_broker_cls
+@pytest.mark.parametrize("kombu_worker_threads", [2], indirect=True)
 def test_rabbitmq_actors_can_be_sent_messages(kombu_broker, kombu_worker):
     # Given that I have a database
     database = {}
@@ -76,15 +101,16 @@ def test_rabbitmq_actors_can_be_sent_messages(kombu_broker, kombu_worker):
     assert len(database) == 10
 
 
-def test_rabbitmq__retries_middleware__actors_retry_with_backoff_on_failure(
-    kombu_broker, kombu_worker
-):
+@parametrize_all_kombu_broker_cls
+def test_rabbitmq__retries_middleware__actors_retry_with_backoff_on_failure(kombu_broker):
     # Given that I have a database
     failure_time, success_time = 0, 0
     succeeded = Event()
 
-    min_backoff = 1000
-    max_backoff = 5000
+    min_backoff = 10
+    max_backoff = 500
+    # retried message leaves delay queue on next consumer iteration, bounded by worker_timeout
+    worker_timeout = 100
 
     # And an actor that fails the first time it's called
     @dramatiq.actor(min_backoff=min_backoff, max_backoff=max_backoff)
@@ -97,19 +123,26 @@ def test_rabbitmq__retries_middleware__actors_retry_with_backoff_on_failure(
             success_time = current_millis()
             succeeded.set()
 
-    # If I send it a message
-    do_work.send()
+    worker = Worker(kombu_broker, worker_threads=1, worker_timeout=worker_timeout)
+    worker.start()
 
-    # Then wait for the actor to succeed
-    succeeded.wait(timeout=30)
+    try:
+        # If I send it a message
+        do_work.send()
+
+        # Then wait for the actor to succeed
+        assert succeeded.wait(timeout=5)
+    finally:
+        worker.stop()
 
     # I expect backoff time to have passed between success and failure
 
     # https://github.com/Bogdanp/dramatiq/issues/651
     # assert min_backoff <= (success_time - failure_time) <= max_backoff
-    assert (success_time - failure_time) <= max_backoff
+    assert 0 < (success_time - failure_time) <= max_backoff + worker_timeout
 
 
+@parametrize_all_kombu_broker_cls
 def test_rabbitmq__retries_middleware__actors_can_retry_multiple_times(kombu_broker, kombu_worker):
     # Given that I have a database
     attempts = []
@@ -117,7 +150,7 @@ def test_rabbitmq__retries_middleware__actors_can_retry_multiple_times(kombu_bro
     done = Event()
 
     # And an actor that fails 3 times then succeeds
-    @dramatiq.actor(max_backoff=1000)
+    @dramatiq.actor(min_backoff=10, max_backoff=100)
     def do_work():
         attempts.append(1)
         if sum(attempts) < 4:
@@ -128,7 +161,7 @@ def test_rabbitmq__retries_middleware__actors_can_retry_multiple_times(kombu_bro
     do_work.send()
 
     # Then join on the queue
-    done.wait(timeout=30)
+    assert done.wait(timeout=5)
     kombu_worker.join()
 
     # I expect it to have been attempted 4 times
@@ -188,6 +221,7 @@ def test_rabbitmq_actors_can_delay_messages_independent_of_each_other(kombu_brok
         worker.stop()
 
 
+@parametrize_all_kombu_broker_cls
 def test_rabbitmq_actors_can_have_retry_limits(kombu_broker, kombu_worker):
     # Given that I have an actor that always fails
 
@@ -272,6 +306,7 @@ def test_kombu_broker__conn_pool___connections_are_lazy(
 
 
 @pytest.mark.parametrize("kombu_max_declare_attempts", [2], indirect=True)
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker_stops_retrying_declaring_queues_when_max_attempts_reached(
     kombu_broker, kombu_max_declare_attempts
 ):
@@ -292,6 +327,7 @@ def test_kombu_broker_stops_retrying_declaring_queues_when_max_attempts_reached(
             do_work.send()
 
 
+@parametrize_all_kombu_broker_cls
 def test_rabbitmq_messages_belonging_to_missing_actors_are_rejected(kombu_broker, kombu_worker):
     # Given that I have a broker without actors
     # If I send it a message
@@ -314,6 +350,7 @@ def test_rabbitmq_messages_belonging_to_missing_actors_are_rejected(kombu_broker
     assert dead == 1
 
 
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker__producer_reconnects_after_enqueue_failure(kombu_broker):
     # Given that I have an actor
     @dramatiq.actor
@@ -369,6 +406,7 @@ def test_kombu_workers_handle_rabbit_failures_gracefully(kombu_broker, kombu_wor
     assert sum(attempts) >= 1
 
 
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker_can_be_closed_multiple_times(kombu_broker):
     ensure_consumer_connection_rabbitmq(kombu_broker)
     ensure_producer_conneciton_rabbitmq(kombu_broker)
@@ -438,7 +476,7 @@ def test_kombu_broker_can_enqueue_messages_with_priority(kombu_broker, kombu_max
 
         # And then tell the broker to wait for all messages
         worker.resume()
-        kombu_broker.join(queue_name, min_successes=2)
+        kombu_broker.join(queue_name, min_successes=2, timeout=5000)
         worker.join()
 
         # I expect the stored priorities to be saved in decreasing order
@@ -449,6 +487,7 @@ def test_kombu_broker_can_enqueue_messages_with_priority(kombu_broker, kombu_max
         worker.stop()
 
 
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker_retries_declaring_queues_when_connection_related_errors_occur(
     kombu_broker,
 ):
@@ -488,6 +527,7 @@ def test_kombu_broker_retries_declaring_queues_when_connection_related_errors_oc
             worker.stop()
 
 
+@parametrize_all_kombu_broker_cls
 def test_kombu_broker_retries_declaring_queues_when_declared_queue_disappears(kombu_broker):
     executed = False
 
@@ -507,13 +547,8 @@ def test_kombu_broker_retries_declaring_queues_when_declared_queue_disappears(ko
 
     declared_ev = Event()
 
-    class DeclaredMiddleware(Middleware):
-        def after_declare_queue(self, broker, queue_name):
-            if queue_name == flaky_queue_name:
-                declared_ev.set()
-
     # I expect that queue to be declared
-    kombu_broker.add_middleware(DeclaredMiddleware())
+    kombu_broker.add_middleware(DeclaredMiddleware(flaky_queue_name, declared_ev))
     assert declared_ev.wait(timeout=5)
 
     # If I delete the queue
@@ -535,6 +570,7 @@ def test_kombu_broker_retries_declaring_queues_when_declared_queue_disappears(ko
     assert executed
 
 
+@parametrize_all_kombu_broker_cls
 def test_rabbitmq_messages_that_failed_to_decode_are_rejected(kombu_broker, kombu_worker):
     # Given that I have an Actor
     @dramatiq.actor(max_retries=0)
@@ -544,13 +580,7 @@ def test_rabbitmq_messages_that_failed_to_decode_are_rejected(kombu_broker, komb
     old_encoder = dramatiq.get_encoder()
 
     # And an encoder that may fail to decode
-    class BadEncoder(type(old_encoder)):
-        def decode(self, data):
-            if "xfail" in str(data):
-                raise RuntimeError("xfail")
-            return super().decode(data)
-
-    dramatiq.set_encoder(BadEncoder())
+    dramatiq.set_encoder(BadEncoder("xfail"))
 
     try:
         # When I send a message that will fail to decode
@@ -1,24 +1,28 @@
+import copy
+import threading
+
 import amqp.exceptions
-from dramatiq import Message
+import dramatiq
+import pytest
+from dramatiq_kombu_broker import ConnectionSharedKombuBroker
+from dramatiq_kombu_broker.testing import get_consumer_connections, get_producer_connections
+
+from tests.conftest_kombu_broker import make_message, parametrize_all_kombu_broker_cls
 
 
+@parametrize_all_kombu_broker_cls
+@pytest.mark.parametrize("kombu_fast_publish", [False, True], indirect=True)
 def test_enqueue__missing_queue__redeclare(
     mocker,
     kombu_broker_cls,
     kombu_broker,
 ):
-    message = Message(
-        queue_name="some-queue",
-        actor_name="some-actor",
-        args=(),
-        kwargs={},
-        options={},
-    )
+    message = make_message("some-queue")
 
     enqueue_exception = None
     _enqueue_message_orig = kombu_broker._enqueue_message
 
-    def _no_route_enqueue_message(queue_name, message):
+    def _no_route_enqueue_message(queue_name, message, **kwargs):
         nonlocal enqueue_exception
         nonlocal _enqueue_message_mock
 
@@ -32,7 +36,7 @@ def test_enqueue__missing_queue__redeclare(
             channel.queue_delete(queue_name, if_unused=False, if_empty=False)
 
         try:
-            return _enqueue_message_orig(queue_name, message)
+            return _enqueue_message_orig(queue_name, message, **kwargs)
         except Exception as exc:
             enqueue_exception = exc
             raise
@@ -53,3 +57,194 @@ def test_enqueue__missing_queue__redeclare(
     # ensure it was "mandatory=True"
     assert isinstance(enqueue_exception, amqp.exceptions.ChannelError)
     assert enqueue_exception.reply_code == 312  # 312 - no-route
+
+
+@parametrize_all_kombu_broker_cls
+@pytest.mark.parametrize("kombu_fast_publish", [True], indirect=True)
+@pytest.mark.parametrize("kombu_max_priority", [10], indirect=True)
+def test_enqueue__fast_publish__message_consumed(kombu_broker):
+    message = make_message("fast-publish-queue", broker_priority=5)
+
+    kombu_broker.enqueue(message)
+
+    consumer = kombu_broker.consume(message.queue_name, timeout=1000)
+    try:
+        consumed = next(consumer)
+        assert consumed is not None
+        # message decoded same as published by kombu.Producer
+        assert consumed.message_id == message.message_id
+        assert consumed.options["broker_priority"] == 5
+
+        kombu_message = consumed._kombu_message
+        assert kombu_message.content_type == "application/data"
+        assert kombu_message.content_encoding == "binary"
+        assert kombu_message.properties["delivery_mode"] == 2
+        assert kombu_message.properties["priority"] == 5
+
+        consumer.ack(consumed)
+    finally:
+        consumer.close()
+
+
+@pytest.mark.parametrize("kombu_fast_publish", [True], indirect=True)
+def test_enqueue__fast_publish__worker_processes_message(kombu_broker, kombu_worker):
+    processed = threading.Event()
+
+    @dramatiq.actor(queue_name="fast-publish-worker-queue")
+    def do_work(value):
+        assert value == 42
+        processed.set()
+
+    do_work.send(42)
+
+    assert processed.wait(timeout=5)
+
+
+@pytest.fixture()
+def no_retry_sleep(mocker, kombu_broker_cls):
+    """Request it before kombu_broker: broker binds the errback on init"""
+    mocker.patch.object(kombu_broker_cls, "on_connection_error_errback_over_time", return_value=0)
+
+
+@parametrize_all_kombu_broker_cls
+@pytest.mark.parametrize("kombu_fast_publish", [True], indirect=True)
+def test_enqueue__fast_publish__connection_error__retried(mocker, no_retry_sleep, kombu_broker):
+    message = make_message("fast-publish-retry-queue")
+
+    acquire_producer_orig = kombu_broker.connection_holder.acquire_producer
+    acquire_calls = 0
+
+    def _flaky_acquire_producer(*args, **kwargs):
+        nonlocal acquire_calls
+        acquire_calls += 1
+        if acquire_calls == 1:
+            raise amqp.exceptions.RecoverableConnectionError("connection lost")
+        return acquire_producer_orig(*args, **kwargs)
+
+    # each publish attempt acquires producer again, first one fails
+    mocker.patch.object(
+        kombu_broker.connection_holder, "acquire_producer", side_effect=_flaky_acquire_producer
+    )
+
+    kombu_broker.enqueue(message)
+
+    assert acquire_calls == 2
+    queue_len, _, _ = kombu_broker.get_queue_message_counts(message.queue_name)
+    assert queue_len == 1
+
+
+@parametrize_all_kombu_broker_cls
+def test_enqueue_many__ok(kombu_broker):
+    messages = [
+        make_message(queue_name) for queue_name in ("some-queue", "other-queue", "some-queue")
+    ]
+
+    enqueued = kombu_broker.enqueue_many(messages)
+
+    assert [m.message_id for m in enqueued] == [m.message_id for m in messages]
+    assert kombu_broker.get_queue_message_counts("some-queue") == (2, 0, 0)
+    assert kombu_broker.get_queue_message_counts("other-queue") == (1, 0, 0)
+
+
+@parametrize_all_kombu_broker_cls
+def test_declare_pending_queues__ok(kombu_broker):
+    kombu_broker.declare_queue("some-queue")
+    assert "some-queue" in kombu_broker.queues_pending
+
+    kombu_broker.declare_pending_queues()
+
+    assert not kombu_broker.queues_pending
+    assert {"some-queue", "some-queue.DQ", "some-queue.XQ"} <= kombu_broker.queues
+    assert kombu_broker.get_queue_message_counts("some-queue") == (0, 0, 0)
+
+
+@pytest.mark.parametrize("kombu_broker_cls", ["conn-share"], indirect=True)
+@pytest.mark.parametrize(
+    "kombu_broker_connection_holder_options", [{"single_connection": True}], indirect=True
+)
+def test_shared_connection_holder__single_connection__ok(kombu_broker):
+    message = make_message("single-connection-queue")
+
+    assert get_consumer_connections(kombu_broker) == get_producer_connections(kombu_broker)
+
+    kombu_broker.enqueue(message)
+
+    queue_len, _, _ = kombu_broker.get_queue_message_counts(message.queue_name)
+    assert queue_len == 1
+
+
+@pytest.mark.parametrize("kombu_broker_cls", ["conn-pool"], indirect=True)
+def test_consumer__blocking_ack_from_worker_thread__acked(kombu_broker):
+    queue_name = "blocking-ack-queue"
+    for _ in range(3):
+        kombu_broker.enqueue(make_message(queue_name))
+
+    consumer = kombu_broker.consume(queue_name, prefetch=3, timeout=100)
+    # channel is not thread-safe, acks from other threads are handed over to consumer thread
+    assert not consumer.channel_threadsafe
+    assert consumer.blocking_acknowledge
+
+    def _ack_in_thread(messages, timeout):
+        def _ack():
+            for message in messages:
+                consumer.ack(message, timeout=timeout)
+
+        thread = threading.Thread(target=_ack)
+        thread.start()
+        return thread
+
+    try:
+        messages = []
+        while len(messages) < 3:
+            message = next(consumer)
+            if message is not None:
+                messages.append(message)
+
+        # each ack waits until consumer thread (this one) process it
+        thread = _ack_in_thread(messages[:2], timeout=5)
+        while thread.is_alive():
+            next(consumer)
+        thread.join()
+
+        assert all(message.acknowledged for message in messages[:2])
+        assert consumer._done_events.qsize() == 1  # one event reused by both acks
+
+        # nobody process acks, wait timed out and event is not reused
+        thread = _ack_in_thread(messages[2:], timeout=0.01)
+        thread.join()
+        assert not messages[2].acknowledged
+        assert consumer._done_events.qsize() == 0
+
+        next(consumer)  # queued ack processed anyway
+        assert messages[2].acknowledged
+    finally:
+        consumer.close()
+
+    assert kombu_broker.get_queue_message_counts(queue_name) == (0, 0, 0)
+
+
+def test_broker__connection_options_reused__not_modified(rabbitmq_dsn):
+    connection_options = {
+        "hostname": rabbitmq_dsn,
+        "transport_options": {
+            "max_retries": 3,
+            "client_properties": {"product": "some-product"},
+        },
+    }
+    expected_options = copy.deepcopy(connection_options)
+
+    # connections are lazy, nothing is sent to the server
+    brokers = [
+        ConnectionSharedKombuBroker(kombu_connection_options=connection_options) for _ in range(2)
+    ]
+
+    assert connection_options == expected_options
+    for broker in brokers:
+        for connection in (*get_consumer_connections(broker), *get_producer_connections(broker)):
+            transport_options = connection.transport_options
+            assert transport_options["max_retries"] == 3
+            assert transport_options["confirm_publish"] is True
+            assert transport_options["client_properties"]["product"] == "some-product"
+            assert "connection_name" in transport_options["client_properties"]
+
+        broker.close()
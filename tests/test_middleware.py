@@ -0,0 +1,23 @@
+import dramatiq
+from dramatiq import Worker
+from dramatiq_kombu_broker.middleware import DeclareQueuesOnBoot
+
+
+def test_declare_queues_on_boot__worker_started__queues_declared(kombu_broker):
+    kombu_broker.add_middleware(DeclareQueuesOnBoot())
+
+    @dramatiq.actor(queue_name="boot-queue")
+    def do_work():
+        pass
+
+    assert "boot-queue" in kombu_broker.queues_pending
+
+    worker = Worker(kombu_broker, worker_threads=1)
+    worker.start()
+
+    try:
+        assert not kombu_broker.queues_pending
+        assert {"boot-queue", "boot-queue.DQ", "boot-queue.XQ"} <= kombu_broker.queues
+        assert kombu_broker.get_queue_message_counts("boot-queue") == (0, 0, 0)
+    finally:
+        worker.stop()